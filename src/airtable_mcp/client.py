@@ -1,14 +1,324 @@
 """Airtable API client with async HTTP support."""
 
+import asyncio
+import functools
 import os
+import random
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
+from typing import Any
+
 import httpx
+import ijson
+import orjson
 
 BASE_URL = "https://api.airtable.com/v0"
+BASES_PATH = "/meta/bases"
+WHOAMI_PATH = "/meta/whoami"
+
+# Keep connections to api.airtable.com warm across tool calls so bursts of
+# requests don't each pay for a fresh TCP+TLS handshake.
+POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# Airtable allows 5 requests/second per base; pace requests client-side so we
+# rarely see a 429 in the first place.
+RATE_LIMIT = 5
+RATE_WINDOW = 1.0
+# Bucket for calls that aren't scoped to a base (e.g. listing bases)
+GLOBAL_BUCKET = "__global__"
+
+# Adaptive concurrency (AIMD): grow by one in-flight request while latency is
+# healthy, halve on rate limits, server errors, or slow responses.
+CONCURRENCY_MIN = 1
+CONCURRENCY_MAX = 10
+CONCURRENCY_START = 5
+LATENCY_TARGET = 0.4
+LATENCY_WINDOW = 20
+
+# Base and table metadata rarely changes; cache it for a few minutes
+META_CACHE_TTL = 300.0
+META_CACHE_SIZE = 128
+
+# Airtable's maximum page size for listing records
+PAGE_SIZE = 100
+
+# Circuit breaker: after this many consecutive failed calls, fail fast
+# without contacting Airtable until the cool-down has passed.
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 30.0
+
+# Airtable accepts at most 10 records per create request. Single-record creates
+# that arrive within COALESCE_WINDOW seconds of each other share one request.
+BATCH_SIZE = 10
+COALESCE_WINDOW = 0.01
+
+# Retry policy for rate limits and transient upstream failures. Total time
+# spent sleeping between attempts is capped so a tool call stays well inside
+# typical MCP client timeouts; a wait that would overrun the budget (such as
+# a long Retry-After) returns the error immediately instead.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_ATTEMPTS = 8
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 4.0
+RETRY_BUDGET = 15.0
+# Non-idempotent methods may already have been applied when a 5xx or a read
+# error comes back, so they are only retried on a 429 or when the request
+# provably never reached Airtable.
+NON_IDEMPOTENT_METHODS = frozenset({"POST"})
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
 
 
 class AirtableError(Exception):
     """Base exception for Airtable operations."""
-    pass
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        maybe_applied: bool = False,
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        # True when a write failed in a way that doesn't tell whether Airtable
+        # applied it (e.g. a 5xx or a dropped connection on a create)
+        self.maybe_applied = maybe_applied
+
+
+class PartialCreateError(AirtableError):
+    """A batch create stopped partway through.
+
+    ``created`` holds the records Airtable confirmed. ``unknown`` holds the
+    fields of a failed request whose outcome can't be told (5xx or dropped
+    connection); they may already exist. ``retryable`` holds fields that
+    were cleanly rejected or never sent, and are safe to send again.
+    """
+
+    def __init__(
+        self,
+        cause: AirtableError,
+        created: list[dict],
+        failed: list[dict],
+        unsent: list[dict],
+    ):
+        self.created = created
+        self.unknown = failed if cause.maybe_applied else []
+        self.retryable = unsent if cause.maybe_applied else failed + unsent
+        parts = [f"{str(cause).rstrip('.')}."]
+        if created:
+            ids = ", ".join(record["id"] for record in created)
+            parts.append(f"Created {len(created)} records ({ids}).")
+        if self.unknown:
+            parts.append(
+                f"The {len(failed)} records in the failed request may or may not have "
+                "been created; check the table before retrying them."
+            )
+        else:
+            parts.append(f"The {len(failed)} records in the failed request were rejected.")
+        if unsent:
+            parts.append(f"The {len(unsent)} records after them were not sent.")
+        if self.retryable:
+            kind = "unsent" if self.unknown else "rejected or unsent"
+            parts.append(f"Only the {len(self.retryable)} {kind} records are safe to retry.")
+        super().__init__(" ".join(parts), cause.status_code, cause.maybe_applied)
+
+
+class _AIMDLimiter:
+    """Bounds in-flight requests with an additive-increase/multiplicative-decrease limit."""
+
+    def __init__(self):
+        self.limit = CONCURRENCY_START
+        self._in_flight = 0
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(
+        self,
+        latency: float | None = None,
+        status_code: int | None = None,
+    ) -> None:
+        """Free a slot and adjust the limit from the finished request.
+
+        ``status_code`` is None when the request failed at the transport level.
+        Without a ``latency`` (e.g. the request was cancelled) the slot is
+        freed and the limit is left unchanged.
+        """
+        async with self._cond:
+            self._in_flight -= 1
+            if latency is not None:
+                self._latencies.append(latency)
+                overloaded = status_code is None or status_code in RETRY_STATUSES
+                if overloaded or latency > LATENCY_TARGET:
+                    self.limit = max(CONCURRENCY_MIN, self.limit // 2)
+                elif sum(self._latencies) / len(self._latencies) <= LATENCY_TARGET:
+                    self.limit = min(CONCURRENCY_MAX, self.limit + 1)
+            self._cond.notify_all()
+
+
+class _CircuitBreaker:
+    """Stops sending requests while Airtable is failing consistently.
+
+    Closed: requests flow normally. Open: requests fail immediately until the
+    cool-down passes. Half-open: requests are let through again; one success
+    closes the breaker, one failure re-opens it.
+    """
+
+    def __init__(self):
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def check(self) -> None:
+        """Raise if the breaker is open and still cooling down."""
+        if self.state != "open":
+            return
+        remaining = BREAKER_COOLDOWN - (time.monotonic() - self._opened_at)
+        if remaining > 0:
+            raise AirtableError(
+                f"Airtable is failing repeatedly; not sending requests for another "
+                f"{remaining:.0f}s. Try again shortly."
+            )
+        self.state = "half-open"
+
+    def record_success(self) -> None:
+        self.state = "closed"
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == "half-open" or self._failures >= BREAKER_THRESHOLD:
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+
+class _CreateCoalescer:
+    """Collects concurrent single-record creates for one table into batch requests."""
+
+    def __init__(self, client: "AirtableClient", base_id: str, table_id_or_name: str):
+        self._client = client
+        self._base_id = base_id
+        self._table = table_id_or_name
+        self._pending: list[tuple[dict, asyncio.Future]] = []
+        self._timer: asyncio.Task | None = None
+        # Strong references so in-flight flushes aren't garbage collected
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, fields: dict) -> dict:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((fields, future))
+        if len(self._pending) >= BATCH_SIZE:
+            batch, self._pending = self._pending[:BATCH_SIZE], self._pending[BATCH_SIZE:]
+            self._spawn(self._flush(batch))
+        elif self._timer is None:
+            self._timer = self._spawn(self._flush_later())
+        return await future
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(COALESCE_WINDOW)
+        self._timer = None
+        batch, self._pending = self._pending, []
+        for i in range(0, len(batch), BATCH_SIZE):
+            await self._flush(batch[i:i + BATCH_SIZE])
+
+    async def _flush(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        if not batch:
+            return
+        try:
+            records = await self._client._post_records(
+                self._base_id, self._table, [fields for fields, _ in batch]
+            )
+        except AirtableError as e:
+            if len(batch) == 1 or e.status_code != 422:
+                for _, future in batch:
+                    _set_exception(future, e)
+                return
+            # One invalid record fails the whole request; retry each record
+            # alone so only its own caller sees the validation error.
+            await asyncio.gather(*(self._flush([item]) for item in batch))
+            return
+        except Exception as e:
+            for _, future in batch:
+                _set_exception(future, e)
+            return
+        for (_, future), record in zip(batch, records):
+            if not future.done():
+                future.set_result(record)
+
+
+def _set_exception(future: asyncio.Future, exc: BaseException) -> None:
+    if not future.done():
+        future.set_exception(exc)
+
+
+@functools.lru_cache(maxsize=256)
+def _table_path(base_id: str, table_id_or_name: str) -> str:
+    """URL path for a table's records, relative to BASE_URL."""
+    return f"/{base_id}/{table_id_or_name}"
+
+
+@functools.lru_cache(maxsize=64)
+def _tables_path(base_id: str) -> str:
+    """URL path for a base's table metadata, relative to BASE_URL."""
+    return f"/meta/bases/{base_id}/tables"
+
+
+class _RecordsPageParser:
+    """Incrementally parses a list-records response body fed in chunks.
+
+    Records are built one at a time from ijson events as their bytes arrive,
+    so the raw body is never buffered whole. The page's pagination token, if
+    any, is read from the same events into ``offset``. This trades CPU for
+    memory: it is over 10x slower than orjson on a full page, so it is only
+    used by iter_records, not list_records.
+    """
+
+    def __init__(self):
+        self.offset: str | None = None
+        self._events = ijson.sendable_list()
+        self._parser = ijson.parse_coro(self._events, use_float=True)
+        self._builder = None
+
+    def feed(self, chunk: bytes) -> list[dict]:
+        """Parse a chunk of the body and return the records it completed."""
+        self._parser.send(chunk)
+        return self._drain()
+
+    def close(self) -> list[dict]:
+        """Finish parsing and return any records completed by the end of input."""
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> list[dict]:
+        records = []
+        for prefix, event, value in self._events:
+            if self._builder is not None:
+                self._builder.event(event, value)
+                if prefix == "records.item" and event == "end_map":
+                    records.append(self._builder.value)
+                    self._builder = None
+            elif prefix == "records.item" and event == "start_map":
+                self._builder = ijson.ObjectBuilder()
+                self._builder.event(event, value)
+            elif prefix == "offset" and event == "string":
+                self.offset = value
+        del self._events[:]
+        return records
 
 
 class AirtableClient:
@@ -21,65 +331,293 @@ class AirtableClient:
                 "AIRTABLE_API_KEY environment variable is required. "
                 "Get your API key at https://airtable.com/create/tokens"
             )
-        self._client: httpx.AsyncClient | None = None
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        # Built once per client so the keep-alive pool lives as long as the
+        # process. Constructing an AsyncClient doesn't touch the event loop;
+        # connections are only opened on first request.
+        self._client = self._build_client()
+        # Timestamps of recent requests, keyed by base ID
+        self._buckets: dict[str, deque[float]] = {}
+        self._limiter = _AIMDLimiter()
+        self._breaker = _CircuitBreaker()
+        # Reusable request bodies, indexed by batch size for creates. They are
+        # filled and serialized with no await in between, so concurrent calls
+        # on the event loop can never observe each other's fields.
+        self._create_scratch = [
+            {"records": [{"fields": None} for _ in range(n)]} for n in range(BATCH_SIZE + 1)
+        ]
+        self._update_scratch = {"fields": None}
+        self._coalescers: dict[tuple[str, str], _CreateCoalescer] = {}
+        # key -> (fetched_at, value), least recently used first
+        self._meta_cache: dict[str, tuple[float, Any]] = {}
+
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=BASE_URL,
+            headers=self._headers,
+            timeout=30.0,
+            limits=POOL_LIMITS,
+            http2=True,
+        )
 
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=BASE_URL,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                timeout=30.0,
-            )
+        if self._client.is_closed:
+            self._client = self._build_client()
         return self._client
 
     async def close(self):
-        if self._client:
+        if not self._client.is_closed:
             await self._client.aclose()
-            self._client = None
+
+    async def warm_up(self) -> None:
+        """Open a pooled connection to Airtable ahead of the first real call.
+
+        This resolves DNS and completes the TCP+TLS (and HTTP/2) handshake up
+        front. It uses the cheap whoami endpoint and ignores the outcome; any
+        real problem is reported by the first tool call instead.
+        """
+        client = await self._get_client()
+        try:
+            response = await client.get(WHOAMI_PATH)
+            await response.aclose()
+        except httpx.HTTPError:
+            pass
+
+    async def _acquire(self, bucket: str) -> None:
+        """Wait until another request may be sent for this bucket."""
+        window = self._buckets.setdefault(bucket, deque())
+        while True:
+            now = time.monotonic()
+            while window and now - window[0] >= RATE_WINDOW:
+                window.popleft()
+            if len(window) < RATE_LIMIT:
+                window.append(now)
+                return
+            await asyncio.sleep(RATE_WINDOW - (now - window[0]))
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        bucket: str,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send one request inside an adaptive concurrency slot.
+
+        The rate-limit slot for ``bucket`` is taken only once a concurrency
+        slot is held, right before sending, so time spent queueing for
+        concurrency can't push paced requests into the same second.
+
+        With ``stream=True`` the body is left unread and the caller must close
+        the response.
+        """
+        await self._limiter.acquire()
+        try:
+            await self._acquire(bucket)
+            t0 = time.monotonic()
+            request = client.build_request(method, url, **kwargs)
+            response = await client.send(request, stream=stream)
+        except httpx.TransportError:
+            await self._limiter.release(time.monotonic() - t0, None)
+            raise
+        except BaseException:
+            # Cancelled or failed locally: says nothing about Airtable's health
+            await self._limiter.release()
+            raise
+        await self._limiter.release(time.monotonic() - t0, response.status_code)
+        return response
+
+    @staticmethod
+    def _retry_delay(attempt: int, response: httpx.Response | None) -> float:
+        """Seconds to wait before the next attempt.
+
+        Honors a numeric Retry-After header as sent (Airtable's 429 penalty is
+        30s; retrying sooner only extends it), otherwise uses capped
+        exponential backoff with jitter so concurrent callers don't retry in
+        lockstep.
+        """
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return max(0.0, float(retry_after))
+                except ValueError:
+                    pass
+        delay = min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt)
+        return delay * random.uniform(0.5, 1.5)
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        bucket: str = GLOBAL_BUCKET,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a request, retrying 429/5xx responses and connection errors.
+
+        Every attempt, including retries, is paced by the rate limiter for
+        ``bucket`` (the base ID for base-scoped endpoints). POST requests are
+        only retried on 429 or when the request never left the client, so a
+        record is never created twice.
+
+        The final response is returned as-is (even if it is still an error) so
+        _handle_error can turn it into a friendly message. Pass ``stream=True``
+        to get the response with its body unread (see _send).
+
+        Fails fast with AirtableError while the circuit breaker is open. The
+        breaker sees one outcome per call, after retries: a 5xx or connection
+        failure counts against it, a 429 is left to the rate limiters.
+        """
+        self._breaker.check()
+        try:
+            response = await self._send_with_retries(method, url, bucket, **kwargs)
+        except AirtableError:
+            self._breaker.record_failure()
+            raise
+        if response.status_code in RETRY_STATUSES - {429}:
+            self._breaker.record_failure()
+        elif response.status_code != 429:
+            self._breaker.record_success()
+        return response
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        url: str,
+        bucket: str,
+        **kwargs,
+    ) -> httpx.Response:
+        """Retry loop behind _request_with_retry."""
+        client = await self._get_client()
+        idempotent = method not in NON_IDEMPOTENT_METHODS
+        deadline = time.monotonic() + RETRY_BUDGET
+        attempt = 0
+        while True:
+            try:
+                response = await self._send(client, method, url, bucket, **kwargs)
+            except httpx.TransportError as e:
+                retryable = idempotent or isinstance(e, UNSENT_ERRORS)
+                delay = self._retry_delay(attempt, None)
+                if not retryable:
+                    raise AirtableError(
+                        f"Lost connection to Airtable before it replied ({e}). "
+                        "The change may or may not have been saved; check before retrying.",
+                        maybe_applied=True,
+                    ) from e
+                if attempt + 1 >= MAX_ATTEMPTS or time.monotonic() + delay > deadline:
+                    raise AirtableError(f"Could not reach Airtable: {e}") from e
+            else:
+                status = response.status_code
+                if not idempotent and status in RETRY_STATUSES - {429}:
+                    await response.aread()
+                    raise AirtableError(
+                        f"Airtable API error: {status} - {response.text}. "
+                        "The change may or may not have been saved; check before retrying.",
+                        status,
+                        maybe_applied=True,
+                    )
+                retryable = status == 429 or (idempotent and status in RETRY_STATUSES)
+                if not retryable:
+                    return response
+                delay = self._retry_delay(attempt, response)
+                if attempt + 1 >= MAX_ATTEMPTS or time.monotonic() + delay > deadline:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
 
     def _handle_error(self, response: httpx.Response) -> None:
         """Raise helpful errors for non-2xx responses."""
         if response.status_code == 401:
-            raise AirtableError("Invalid API key. Check your AIRTABLE_API_KEY.")
+            raise AirtableError("Invalid API key. Check your AIRTABLE_API_KEY.", 401)
         if response.status_code == 403:
-            raise AirtableError("Permission denied. Your API key lacks access to this resource.")
+            raise AirtableError("Permission denied. Your API key lacks access to this resource.", 403)
         if response.status_code == 404:
-            raise AirtableError("Not found. Check that the base/table/record ID is correct.")
+            raise AirtableError("Not found. Check that the base/table/record ID is correct.", 404)
         if response.status_code == 422:
-            error = response.json().get("error", {})
-            raise AirtableError(f"Invalid request: {error.get('message', 'Unknown error')}")
+            error = orjson.loads(response.content).get("error", {})
+            raise AirtableError(f"Invalid request: {error.get('message', 'Unknown error')}", 422)
         if response.status_code == 429:
-            raise AirtableError("Rate limited. Airtable allows 5 requests/second. Wait and retry.")
+            raise AirtableError(
+                "Rate limited. Airtable allows 5 requests/second and retries were exhausted. "
+                "Wait and retry.",
+                429,
+            )
+        if not response.is_success:
+            raise AirtableError(
+                f"Airtable API error: {response.status_code} - {response.text}",
+                response.status_code,
+            )
+
+    async def _cached(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        refresh: bool = False,
+    ) -> Any:
+        """Return a fresh cached value for ``key``, fetching it if missing or stale."""
+        entry = self._meta_cache.pop(key, None)
+        if entry is not None and not refresh and time.monotonic() - entry[0] < META_CACHE_TTL:
+            self._meta_cache[key] = entry  # re-insert as most recently used
+            return entry[1]
+        value = await fetch()
+        self._meta_cache[key] = (time.monotonic(), value)
+        while len(self._meta_cache) > META_CACHE_SIZE:
+            del self._meta_cache[next(iter(self._meta_cache))]
+        return value
+
+    def _invalidate_tables(self, base_id: str) -> None:
+        self._meta_cache.pop(f"tables:{base_id}", None)
+
+    def _handle_write_error(self, response: httpx.Response, base_id: str) -> None:
+        """Like _handle_error, but drops cached tables for the base on failure.
+
+        A rejected write often means the cached schema (tables or fields) is
+        out of date.
+        """
         if not response.is_success:
-            raise AirtableError(f"Airtable API error: {response.status_code} - {response.text}")
+            self._invalidate_tables(base_id)
+        self._handle_error(response)
 
-    async def list_bases(self) -> list[dict]:
+    async def list_bases(self, refresh: bool = False) -> list[dict]:
         """List all bases accessible to the API key.
 
+        Args:
+            refresh: Bypass the metadata cache
+
         Returns:
             List of bases with id, name, permissionLevel
         """
-        client = await self._get_client()
-        response = await client.get("/meta/bases")
-        self._handle_error(response)
-        return response.json().get("bases", [])
+        async def fetch():
+            response = await self._request_with_retry("GET", BASES_PATH)
+            self._handle_error(response)
+            return orjson.loads(response.content).get("bases", [])
 
-    async def list_tables(self, base_id: str) -> list[dict]:
+        return await self._cached("bases", fetch, refresh)
+
+    async def list_tables(self, base_id: str, refresh: bool = False) -> list[dict]:
         """List all tables in a base.
 
         Args:
             base_id: The base ID (starts with 'app')
+            refresh: Bypass the metadata cache
 
         Returns:
             List of tables with id, name, fields
         """
-        client = await self._get_client()
-        response = await client.get(f"/meta/bases/{base_id}/tables")
-        self._handle_error(response)
-        return response.json().get("tables", [])
+        async def fetch():
+            response = await self._request_with_retry(
+                "GET", _tables_path(base_id), bucket=base_id
+            )
+            self._handle_error(response)
+            return orjson.loads(response.content).get("tables", [])
+
+        return await self._cached(f"tables:{base_id}", fetch, refresh)
 
     async def list_records(
         self,
@@ -88,27 +626,103 @@ class AirtableClient:
         max_records: int | None = None,
         filter_formula: str | None = None,
     ) -> list[dict]:
-        """List records from a table.
+        """List records from a table, following pagination.
 
         Args:
             base_id: The base ID (starts with 'app')
             table_id_or_name: Table ID or name
-            max_records: Maximum records to return (default 100)
+            max_records: Maximum records to return (default: all)
             filter_formula: Airtable formula to filter records
 
         Returns:
             List of records with id, createdTime, fields
         """
-        client = await self._get_client()
-        params = {}
+        # The whole list is returned anyway, so buffer each page and parse it
+        # with orjson rather than streaming it through iter_records.
+        params = self._list_params(max_records, filter_formula)
+        path = _table_path(base_id, table_id_or_name)
+        records: list[dict] = []
+        while True:
+            response = await self._request_with_retry("GET", path, bucket=base_id, params=params)
+            self._handle_error(response)
+            page = orjson.loads(response.content)
+            records += page.get("records", [])
+            offset = page.get("offset")
+            if max_records is not None and len(records) >= max_records:
+                return records[:max_records]
+            if not offset:
+                return records
+            params["offset"] = offset
+
+    @staticmethod
+    def _list_params(max_records: int | None, filter_formula: str | None) -> dict:
+        params = {"pageSize": PAGE_SIZE}
         if max_records is not None:
             params["maxRecords"] = max_records
         if filter_formula is not None:
             params["filterByFormula"] = filter_formula
+        return params
 
-        response = await client.get(f"/{base_id}/{table_id_or_name}", params=params)
-        self._handle_error(response)
-        return response.json().get("records", [])
+    async def iter_records(
+        self,
+        base_id: str,
+        table_id_or_name: str,
+        max_records: int | None = None,
+        filter_formula: str | None = None,
+    ) -> AsyncIterator[dict]:
+        """Yield records from a table one at a time, fetching a page at a time.
+
+        Pages are streamed and parsed incrementally, so page bodies are never
+        buffered whole, at the cost of slower parsing. Prefer list_records
+        when the whole result is needed anyway.
+
+        Args:
+            base_id: The base ID (starts with 'app')
+            table_id_or_name: Table ID or name
+            max_records: Maximum records to yield (default: all)
+            filter_formula: Airtable formula to filter records
+
+        Yields:
+            Records with id, createdTime, fields
+        """
+        params = self._list_params(max_records, filter_formula)
+        path = _table_path(base_id, table_id_or_name)
+        remaining = max_records
+        while True:
+            response = await self._request_with_retry(
+                "GET", path, bucket=base_id, stream=True, params=params
+            )
+            try:
+                if not response.is_success:
+                    await response.aread()
+                    self._handle_error(response)
+                parser = _RecordsPageParser()
+                async with aclosing(self._iter_parsed(response, parser)) as pages:
+                    async for records in pages:
+                        for record in records:
+                            if remaining is not None:
+                                if remaining <= 0:
+                                    return
+                                remaining -= 1
+                            yield record
+            finally:
+                await response.aclose()
+            if not parser.offset or remaining == 0:
+                return
+            params["offset"] = parser.offset
+
+    @staticmethod
+    async def _iter_parsed(
+        response: httpx.Response,
+        parser: _RecordsPageParser,
+    ) -> AsyncIterator[list[dict]]:
+        """Feed a streamed response body to ``parser`` chunk by chunk."""
+        try:
+            async for chunk in response.aiter_bytes():
+                yield parser.feed(chunk)
+        except httpx.TransportError as e:
+            raise AirtableError(f"Connection to Airtable dropped mid-response: {e}") from e
+        yield parser.close()
 
     async def create_record(
         self,
@@ -126,11 +740,68 @@ class AirtableClient:
         Returns:
             The created record with id, createdTime, fields
         """
-        client = await self._get_client()
-        payload = {"records": [{"fields": fields}]}
-        response = await client.post(f"/{base_id}/{table_id_or_name}", json=payload)
-        self._handle_error(response)
-        return response.json()["records"][0]
+        key = (base_id, table_id_or_name)
+        coalescer = self._coalescers.get(key)
+        if coalescer is None:
+            coalescer = self._coalescers[key] = _CreateCoalescer(self, base_id, table_id_or_name)
+        return await coalescer.submit(fields)
+
+    async def create_records(
+        self,
+        base_id: str,
+        table_id_or_name: str,
+        records: list[dict],
+    ) -> list[dict]:
+        """Create several records in a table, 10 per request.
+
+        Args:
+            base_id: The base ID (starts with 'app')
+            table_id_or_name: Table ID or name
+            records: List of field dictionaries, one per record
+
+        Returns:
+            The created records, in the same order as ``records``
+
+        Raises:
+            PartialCreateError: A request failed with other records created
+                before it or still unsent; see its ``created``, ``unknown``
+                and ``retryable`` attributes
+        """
+        created: list[dict] = []
+        for i in range(0, len(records), BATCH_SIZE):
+            chunk = records[i:i + BATCH_SIZE]
+            try:
+                created += await self._post_records(base_id, table_id_or_name, chunk)
+            except AirtableError as e:
+                unsent = records[i + BATCH_SIZE:]
+                if not created and not unsent:
+                    raise
+                raise PartialCreateError(e, created, chunk, unsent) from e
+        return created
+
+    async def _post_records(
+        self,
+        base_id: str,
+        table_id_or_name: str,
+        records: list[dict],
+    ) -> list[dict]:
+        """Create up to BATCH_SIZE records in a single request."""
+        payload = self._create_scratch[len(records)]
+        for entry, fields in zip(payload["records"], records):
+            entry["fields"] = fields
+        try:
+            body = orjson.dumps(payload)
+        finally:
+            for entry in payload["records"]:
+                entry["fields"] = None
+        response = await self._request_with_retry(
+            "POST",
+            _table_path(base_id, table_id_or_name),
+            bucket=base_id,
+            content=body,
+        )
+        self._handle_write_error(response, base_id)
+        return orjson.loads(response.content)["records"]
 
     async def update_record(
         self,
@@ -150,11 +821,16 @@ class AirtableClient:
         Returns:
             The updated record
         """
-        client = await self._get_client()
-        payload = {"fields": fields}
-        response = await client.patch(
-            f"/{base_id}/{table_id_or_name}/{record_id}",
-            json=payload
+        self._update_scratch["fields"] = fields
+        try:
+            body = orjson.dumps(self._update_scratch)
+        finally:
+            self._update_scratch["fields"] = None
+        response = await self._request_with_retry(
+            "PATCH",
+            f"{_table_path(base_id, table_id_or_name)}/{record_id}",
+            bucket=base_id,
+            content=body,
         )
-        self._handle_error(response)
-        return response.json()
+        self._handle_write_error(response, base_id)
+        return orjson.loads(response.content)
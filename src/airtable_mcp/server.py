@@ -1,15 +1,34 @@
 """MCP server for Airtable integration."""
 
+import asyncio
+from contextlib import asynccontextmanager
+
+import anyio
 from mcp.server.fastmcp import FastMCP
 from airtable_mcp.client import AirtableClient, AirtableError
 
-# Initialize the MCP server
-mcp = FastMCP("airtable")
-
-# Lazy-initialized client
+# Process-wide client, shared by every tool call
 _client: AirtableClient | None = None
 
 
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Warm up the shared client's connection pool, and close it on shutdown."""
+    # Connect in the background so the MCP handshake isn't delayed
+    warm_up = asyncio.create_task(_client.warm_up()) if _client is not None else None
+    try:
+        yield
+    finally:
+        if warm_up is not None:
+            warm_up.cancel()
+        if _client is not None:
+            await _client.close()
+
+
+# Initialize the MCP server
+mcp = FastMCP("airtable", lifespan=lifespan)
+
+
 def get_client() -> AirtableClient:
     """Get or create the Airtable client."""
     global _client
@@ -18,30 +37,31 @@ def get_client() -> AirtableClient:
     return _client
 
 
-@mcp.tool()
-async def list_bases() -> list[dict]:
+async def list_bases(refresh: bool = False) -> list[dict]:
     """List all Airtable bases accessible to your account.
 
+    Args:
+        refresh: Skip the 5-minute cache and fetch the latest list
+
     Returns a list of bases with their ID, name, and your permission level.
     Use the base ID in subsequent calls to list_tables and record operations.
     """
-    return await get_client().list_bases()
+    return await get_client().list_bases(refresh=refresh)
 
 
-@mcp.tool()
-async def list_tables(base_id: str) -> list[dict]:
+async def list_tables(base_id: str, refresh: bool = False) -> list[dict]:
     """List all tables in an Airtable base.
 
     Args:
         base_id: The base ID (starts with 'app', e.g., 'appABC123')
+        refresh: Skip the 5-minute cache and fetch the latest schema
 
     Returns a list of tables with their ID, name, and field definitions.
     Use the table ID or name in record operations.
     """
-    return await get_client().list_tables(base_id)
+    return await get_client().list_tables(base_id, refresh=refresh)
 
 
-@mcp.tool()
 async def list_records(
     base_id: str,
     table_id_or_name: str,
@@ -66,7 +86,6 @@ async def list_records(
     )
 
 
-@mcp.tool()
 async def create_record(
     base_id: str,
     table_id_or_name: str,
@@ -87,7 +106,33 @@ async def create_record(
     return await get_client().create_record(base_id, table_id_or_name, fields)
 
 
-@mcp.tool()
+async def create_records(
+    base_id: str,
+    table_id_or_name: str,
+    records: list[dict],
+) -> list[dict]:
+    """Create several records in an Airtable table at once.
+
+    Prefer this over repeated create_record calls when adding many rows;
+    records are sent 10 per request, in order, stopping at the first failure.
+    The error then lists the records already created and says which of the
+    rest are safe to retry. Records in a request that failed with a server
+    or connection error may already exist; check the table before resending
+    them.
+
+    Args:
+        base_id: The base ID (starts with 'app')
+        table_id_or_name: Table ID or table name
+        records: List of dictionaries, each mapping field names to values
+
+    Returns the created records, in the same order they were given.
+
+    Example:
+        create_records("appABC123", "Tasks", [{"Name": "Task A"}, {"Name": "Task B"}])
+    """
+    return await get_client().create_records(base_id, table_id_or_name, records)
+
+
 async def update_record(
     base_id: str,
     table_id_or_name: str,
@@ -110,9 +155,36 @@ async def update_record(
     return await get_client().update_record(base_id, table_id_or_name, record_id, fields)
 
 
+# Tools exposed over MCP, registered in one place rather than by decorator
+TOOLS = (
+    list_bases,
+    list_tables,
+    list_records,
+    create_record,
+    create_records,
+    update_record,
+)
+
+for _tool in TOOLS:
+    mcp.add_tool(_tool)
+
+
 def main():
     """Entry point for the MCP server."""
-    mcp.run(transport="stdio")
+    # Create the client up front so its connection pool is shared for the
+    # whole stdio session. A missing API key is reported on the first tool
+    # call instead of crashing the server.
+    try:
+        get_client()
+    except AirtableError:
+        pass
+    # uvloop is an optional speed-up (not available on Windows)
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        mcp.run(transport="stdio")
+    else:
+        anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": True})
 
 
 if __name__ == "__main__":